@@ -88,38 +88,28 @@ def test_neighbors():
 
 def test_to_ij(triangle_mesh, mixed_mesh):
     faces = triangle_mesh
-    actual_i, actual_j = connectivity._to_ij(faces, invert=False)
+    actual_i, actual_j = connectivity._to_ij(faces)
     expected_i = [0, 0, 0, 1, 1, 1]
     expected_j = [0, 1, 2, 1, 3, 2]
     assert np.array_equal(actual_i, expected_i)
     assert np.array_equal(actual_j, expected_j)
 
-    # Inverted
-    actual_i, actual_j = connectivity._to_ij(faces, invert=True)
-    assert np.array_equal(actual_i, expected_j)
-    assert np.array_equal(actual_j, expected_i)
-
     faces = mixed_mesh
-    actual_i, actual_j = connectivity._to_ij(faces, invert=False)
+    actual_i, actual_j = connectivity._to_ij(faces)
     expected_i = [0, 0, 0, 1, 1, 1, 1]
     expected_j = [0, 1, 2, 1, 3, 4, 2]
     assert np.array_equal(actual_i, expected_i)
     assert np.array_equal(actual_j, expected_j)
 
-    # Inverted
-    actual_i, actual_j = connectivity._to_ij(faces, invert=True)
-    assert np.array_equal(actual_i, expected_j)
-    assert np.array_equal(actual_j, expected_i)
-
 
 def test_to_sparse(mixed_mesh):
     faces = mixed_mesh
-    csr = connectivity._to_sparse(faces, invert=False, sort_indices=True)
+    csr = connectivity._to_sparse(faces, sort_indices=True)
     expected_j = np.array([0, 1, 2, 1, 2, 3, 4])
     assert np.array_equal(csr.indices, expected_j)
     assert csr.has_sorted_indices
 
-    csr = connectivity._to_sparse(faces, invert=False, sort_indices=False)
+    csr = connectivity._to_sparse(faces, sort_indices=False)
     expected_j = np.array([0, 1, 2, 1, 3, 4, 2])
     assert np.array_equal(csr.indices, expected_j)
     assert not csr.has_sorted_indices
@@ -182,6 +172,28 @@ def test_invert_dense(triangle_mesh, mixed_mesh):
     assert np.array_equal(actual, expected)
 
 
+def test_invert_dense_to_sparse(mixed_mesh):
+    faces = mixed_mesh
+    actual = connectivity.invert_dense_to_sparse(faces)
+    assert isinstance(actual, sparse.csr_matrix)
+    assert actual.shape == (5, 2)
+    assert actual.has_sorted_indices
+    assert np.array_equal(actual.indptr, [0, 1, 3, 5, 6, 7])
+    assert np.array_equal(actual.indices, [0, 0, 1, 0, 1, 1, 1])
+    assert np.array_equal(actual.data, actual.indices)
+
+    # Repeated values in a row are summed, like in the COO to CSR conversion.
+    conn = np.array([[0, 1, 1], [2, 0, FILL_VALUE]])
+    actual = connectivity.invert_dense_to_sparse(conn)
+    assert np.array_equal(actual.indptr, [0, 2, 3, 4])
+    assert np.array_equal(actual.indices, [0, 1, 0, 1])
+
+    with pytest.warns(FutureWarning, match="sort_indices has been deprecated"):
+        connectivity.invert_dense_to_sparse(faces, sort_indices=False)
+    with pytest.warns(FutureWarning, match="sort_indices has been deprecated"):
+        connectivity.invert_dense(faces, sort_indices=True)
+
+
 def test_invert_sparse(triangle_mesh, mixed_mesh):
     faces = triangle_mesh
     sparse = connectivity.to_sparse(faces)
@@ -279,6 +291,18 @@ def test_renumber():
     assert np.array_equal(actual, expected)
 
 
+def test_unique_indices():
+    a = np.array(
+        [
+            [5, 1, FILL_VALUE],
+            [1, 3, 5],
+        ]
+    )
+    actual = connectivity.unique_indices(a, 7)
+    assert np.array_equal(actual, [1, 3, 5])
+    assert np.array_equal(np.unique(a[a != FILL_VALUE]), actual)
+
+
 def test_renumber_with_fill_value():
     a = np.array(
         [
@@ -588,6 +612,23 @@ class TestEdgeConnectivity:
         assert np.array_equal(coo.data, [1, 2, 3, 3, 4])
 
 
+def test_csr_rows():
+    A = sparse.csr_matrix(
+        np.array(
+            [
+                [0, 1, 1, 0],
+                [0, 0, 0, 0],
+                [1, 0, 0, 1],
+            ]
+        )
+    )
+    rows = np.array([2, 0, 1, 2])
+    n_per_row, indices = connectivity.csr_rows(A.indptr, A.indices, rows)
+    assert np.array_equal(n_per_row, A.getnnz(axis=1)[rows])
+    assert np.array_equal(indices, A[rows].indices)
+    assert np.array_equal(indices, [0, 3, 1, 2, 0, 3])
+
+
 def test_face_face_connectivity():
     edge_faces = np.array(
         [
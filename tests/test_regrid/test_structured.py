@@ -2,7 +2,14 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from xugrid.regrid.structured import StructuredGrid1d, StructuredGrid2d
+from xugrid.regrid.overlap_1d import overlap_1d
+from xugrid.regrid.structured import (
+    StructuredGrid1d,
+    StructuredGrid2d,
+    StructuredGrid3d,
+    _overlap_equidistant,
+    _valid_nodes,
+)
 
 # Testgrids
 # --------
@@ -458,3 +465,108 @@ def test_directional_bounds():
     assert np.array_equal(
         grid_inc.directional_bounds, grid_dec.directional_bounds[::-1]
     )
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_valid_nodes(side):
+    lower = np.arange(0.0, 10.0)
+    upper = lower + 1.0
+    midpoints = np.array([-1.0, 0.0, 0.5, 3.0, 5.5, 9.5, 10.0, 11.0])
+    located, index = _valid_nodes(midpoints, lower, upper, side == "right")
+
+    # Compare with the NumPy reference
+    start = np.searchsorted(lower, midpoints, side=side)
+    end = np.searchsorted(upper, midpoints, side=side)
+    valid = (start == (end + 1)) & (midpoints > lower[0]) & (midpoints < upper[-1])
+    assert np.array_equal(located, end[valid])
+    assert np.array_equal(index, np.flatnonzero(valid))
+
+
+def test_init_1d_equidistant():
+    x = np.array([0.5, 1.5, 2.5, 3.5])
+    da = xr.DataArray(np.ones(4), coords={"x": x}, dims=("x",))
+    grid = StructuredGrid1d(da, "x")
+    assert np.allclose(grid.lower, [0.0, 1.0, 2.0, 3.0])
+    assert np.allclose(grid.upper, [1.0, 2.0, 3.0, 4.0])
+
+    # Equal first and last steps, irregular in between.
+    x = np.array([0.5, 1.5, 3.5, 4.5])
+    da = xr.DataArray(np.ones(4), coords={"x": x}, dims=("x",))
+    with pytest.raises(ValueError, match="has to be equidistant"):
+        StructuredGrid1d(da, "x")
+
+    # The tolerance scales with the square of the step: 1.0 for a step of 100.
+    x = np.array([0.0, 100.0, 200.3, 300.0])
+    da = xr.DataArray(np.ones(4), coords={"x": x}, dims=("x",))
+    grid = StructuredGrid1d(da, "x")
+    assert np.allclose(grid.upper - grid.lower, 100.0)
+    # Also for decreasing values.
+    grid = StructuredGrid1d(da.isel(x=slice(None, None, -1)), "x")
+    assert np.allclose(grid.upper - grid.lower, 100.0)
+
+    x = np.array([0.0, 100.0, 201.5, 300.0])
+    da = xr.DataArray(np.ones(4), coords={"x": x}, dims=("x",))
+    with pytest.raises(ValueError, match="has to be equidistant"):
+        StructuredGrid1d(da, "x")
+
+
+def test_grid_1d_cache():
+    x = np.array([0.5, 1.5, 2.5])
+    y = np.array([1.5, 0.5])
+    da = xr.DataArray(np.ones((2, 3)), coords={"y": y, "x": x}, dims=("y", "x"))
+    grid_a = StructuredGrid2d(da, "x", "y")
+    grid_b = StructuredGrid2d(da * 2.0, "x", "y")
+    assert grid_a.xbounds is grid_b.xbounds
+    assert grid_a.ybounds is grid_b.ybounds
+
+    # Explicit cell sizes are not cached.
+    da = da.assign_coords(dx=1.0)
+    assert StructuredGrid2d(da, "x", "y").xbounds is not grid_a.xbounds
+
+
+def test_shape_3d():
+    da = xr.DataArray(
+        np.ones((4, 2, 3)),
+        coords={"z": np.arange(4.0), "y": np.arange(2.0), "x": np.arange(3.0)},
+        dims=("z", "y", "x"),
+    )
+    grid = StructuredGrid3d(da, "x", "y", "z")
+    assert grid.shape == (4, 2, 3)
+
+
+def test_volume_3d():
+    x = np.array([0.5, 1.5, 2.5])
+    y = np.array([1.0, 3.0])
+    z = np.array([0.25, 0.75, 1.25, 1.75])
+    da = xr.DataArray(
+        np.ones((4, 2, 3)), coords={"z": z, "y": y, "x": x}, dims=("z", "y", "x")
+    )
+    grid = StructuredGrid3d(da, "x", "y", "z")
+    assert grid.shape == (4, 2, 3)
+    assert grid.volume.shape == (4, 2, 3)
+    assert np.allclose(grid.volume, 0.5 * 2.0 * 1.0)
+
+
+@pytest.mark.parametrize(
+    "source_dx, target_dx, target_start",
+    [(1.0, 1.0, 0.0), (1.0, 0.3, -1.1), (0.7, 2.5, 3.3), (0.1, 0.1, 0.05)],
+)
+def test_overlap_equidistant(source_dx, target_dx, target_start):
+    source_mid = (np.arange(20) + 0.5) * source_dx
+    target_mid = target_start + (np.arange(15) + 0.5) * target_dx
+    source_bounds = np.column_stack(
+        (source_mid - 0.5 * source_dx, source_mid + 0.5 * source_dx)
+    )
+    target_bounds = np.column_stack(
+        (target_mid - 0.5 * target_dx, target_mid + 0.5 * target_dx)
+    )
+    actual = _overlap_equidistant(
+        source_bounds[:, 0].copy(),
+        source_bounds[:, 1].copy(),
+        target_bounds[:, 0].copy(),
+        target_bounds[:, 1].copy(),
+        source_dx,
+    )
+    expected = overlap_1d(source_bounds, target_bounds)
+    for a, b in zip(actual, expected):
+        assert np.array_equal(a, b)
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 import xugrid
+from xugrid.regrid.structured import StructuredGrid2d
 from xugrid.regrid.unstructured import UnstructuredGrid2d
 
 
@@ -27,6 +28,12 @@ def test_grid_properties(circle):
     assert circle.area.size == 384
 
 
+def test_convert_to(circle):
+    assert circle.convert_to(UnstructuredGrid2d) is circle
+    with pytest.raises(TypeError, match="Cannot convert UnstructuredGrid2d"):
+        circle.convert_to(StructuredGrid2d)
+
+
 @pytest.mark.parametrize("relative", [True, False])
 def test_overlap(circle, relative):
     source, target, weights = circle.overlap(other=circle, relative=relative)
@@ -18,6 +18,17 @@ def test_create_linear_index():
     expected = np.array([0, 1, 2, 0, 1, 2, 3, 4, 5, 3, 4, 5])
     assert np.array_equal(actual, expected)
 
+    index_a = [0, 1]
+    index_b = [2, 0]
+    index_c = [1, 3, 0]
+    shape = (2, 3, 4)
+    actual = utils.create_linear_index((index_a, index_b, index_c), shape)
+    meshgrids = [
+        a.ravel() for a in np.meshgrid(index_a, index_b, index_c, indexing="ij")
+    ]
+    expected = np.ravel_multi_index(meshgrids, shape)
+    assert np.array_equal(actual, expected)
+
 
 def test_create_weights():
     weights_a = [0.25, 0.25, 0.25, 0.25]
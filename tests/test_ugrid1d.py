@@ -2,6 +2,7 @@ from typing import NamedTuple
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pyproj
 import pytest
 import shapely
@@ -10,6 +11,7 @@ from matplotlib.collections import LineCollection
 from scipy import sparse, spatial
 
 import xugrid
+from xugrid.ugrid.ugridbase import as_pandas_index, is_range_index
 
 from . import requires_meshkernel
 
@@ -271,6 +273,7 @@ def test_clear_geometry_properties():
         "_ymax",
         "_edge_x",
         "_edge_y",
+        "_fingerprint",
     ]:
         setattr(grid, attr, 1)
         grid._clear_geometry_properties()
@@ -473,6 +476,30 @@ def test_topology_subset():
     assert np.array_equal(actual.node_x, [1.0, 2.0])
     assert np.array_equal(actual.node_y, [1.0, 2.0])
 
+    # The identity returns the grid itself.
+    assert grid.topology_subset(np.array([0, 1])) is grid
+    assert grid.topology_subset(np.array([True, True])) is grid
+    assert grid.topology_subset(np.array([1, 0])) is not grid
+
+
+def test_as_pandas_index():
+    index = as_pandas_index(np.array([True, False, True]), 3)
+    assert index.equals(pd.Index([0, 2]))
+    index = as_pandas_index(np.array([True, True, True]), 3)
+    assert isinstance(index, pd.RangeIndex)
+    with pytest.raises(ValueError, match="boolean index size 2 does not match"):
+        as_pandas_index(np.array([True, False]), 3)
+
+
+def test_is_range_index():
+    assert is_range_index(pd.RangeIndex(0, 3), 3)
+    assert is_range_index(pd.Index([0, 1, 2]), 3)
+    assert not is_range_index(pd.RangeIndex(1, 4), 3)
+    assert not is_range_index(pd.RangeIndex(0, 6, 2), 3)
+    assert not is_range_index(pd.Index([0, 2, 1]), 3)
+    assert not is_range_index(pd.Index([0, 1]), 3)
+    assert not is_range_index(pd.Index(["a", "b", "c"]), 3)
+
 
 def test_reindex_like():
     grid = grid1d()
@@ -1,3 +1,4 @@
+import copy
 from typing import NamedTuple
 
 import geopandas as gpd
@@ -114,6 +115,36 @@ def test_safe_attrs():
     assert grid._attrs is not grid.attrs
 
 
+def test_copy():
+    grid = grid2d()
+    copied = grid.copy()
+    assert isinstance(copied, xugrid.Ugrid2d)
+    assert copied is not grid
+    # Arrays are shared, the mutable dictionaries are not.
+    assert copied.node_x is grid.node_x
+    assert copied.face_node_connectivity is grid.face_node_connectivity
+    assert copied._attrs == grid._attrs
+    assert copied._attrs is not grid._attrs
+    assert copied._indexes is not grid._indexes
+
+    copied.set_crs("epsg:4326")
+    copied._attrs["name"] = "copied"
+    assert grid.crs is None
+    assert grid._attrs["name"] == NAME
+
+    # In place modification of an array affects both grids, but not a deep
+    # copy.
+    grid = xugrid.Ugrid2d(*VERTICES.T.copy(), -1, FACES.copy())
+    copied = grid.copy()
+    deep = copy.deepcopy(grid)
+    copied.node_x[0] = 10.0
+    copied.face_node_connectivity[0, 0] = 2
+    assert grid.node_x[0] == 10.0
+    assert grid.face_node_connectivity[0, 0] == 2
+    assert deep.node_x[0] == 0.0
+    assert deep.face_node_connectivity[0, 0] == 0
+
+
 def test_ugrid2d_alternative_init():
     custom_attrs = {
         "node_dimension": "nNetNode",
@@ -168,6 +199,8 @@ def test_ugrid2d_properties():
     are_nan = np.isnan(face_node_coords)
     assert are_nan[2:, -1:, :].all()
     assert not are_nan[:, :-1, :].any()
+    assert np.array_equal(face_node_coords[0], VERTICES[FACES[0]])
+    assert np.array_equal(edge_node_coords, VERTICES[grid.edge_node_connectivity])
     assert isinstance(grid.attrs, dict)
     coords = grid.coords
     assert isinstance(coords, dict)
@@ -185,6 +218,26 @@ def test_ugrid2d_properties():
     assert isinstance(grid.face_kdtree, spatial.KDTree)
 
 
+def test_ugrid2d_properties_float32():
+    grid = xugrid.Ugrid2d(
+        node_x=VERTICES[:, 0].astype(np.float32),
+        node_y=VERTICES[:, 1].astype(np.float32),
+        fill_value=-1,
+        face_node_connectivity=FACES,
+    )
+    assert grid.node_coordinates.dtype == np.float32
+    assert grid.edge_node_coordinates.dtype == np.float32
+    assert grid.face_node_coordinates.dtype == np.float32
+    assert grid.edge_bounds.dtype == np.float32
+    assert grid.face_bounds.dtype == np.float32
+    assert grid.edge_x.dtype == np.float32
+    assert grid.edge_y.dtype == np.float32
+    assert np.array_equal(
+        grid.face_node_coordinates, grid2d().face_node_coordinates, equal_nan=True
+    )
+    assert np.array_equal(grid.face_bounds, grid2d().face_bounds)
+
+
 def test_validate_edge_node_connectivity():
     # Full test at test_connectivity
     grid = grid2d()
@@ -239,9 +292,12 @@ def test_set_crs():
 def test_to_crs():
     grid = grid2d()
     grid.set_crs("epsg:4326")
+    original_x = grid.node_x.copy()
     reprojected = grid.to_crs("epsg:28992")
     assert reprojected.crs == pyproj.CRS.from_epsg(28992)
     assert (~(grid.node_coordinates == reprojected.node_coordinates)).all()
+    # The original grid must not be modified.
+    assert np.array_equal(grid.node_x, original_x)
 
 
 def test_to_dataset():
@@ -326,6 +382,16 @@ def test_ugrid2d_set_node_coords():
     assert grid._indexes["node_x"] == "lon"
     assert grid._indexes["node_y"] == "lat"
     assert not grid.projected
+    # Contiguous input is used as is, without a copy.
+    assert np.shares_memory(grid.node_x, lonvalues)
+    assert np.shares_memory(grid.node_y, latvalues)
+
+    # Lazy coordinates are loaded.
+    ds = ds.chunk({grid.node_dimension: 3})
+    grid.set_node_coords("lat", "lon", ds)
+    assert isinstance(grid.node_x, np.ndarray)
+    assert np.allclose(grid.node_x, latvalues)
+    assert np.allclose(grid.node_y, lonvalues)
 
 
 def test_ugrid2d_dataset_roundtrip():
@@ -349,6 +415,48 @@ def test_ugrid2d_dataset_no_mutation():
     assert ds.identical(reference)
 
 
+def test_prepare_connectivity():
+    data = np.array([[0.0, 1.0, 2.0], [2.0, 3.0, np.nan]])
+    da = xr.DataArray(data, dims=("face", "nmax"))
+    actual = xugrid.Ugrid2d._prepare_connectivity(da, -1, dtype=np.int64)
+    assert actual.dtype == np.int64
+    assert np.array_equal(actual, [[0, 1, 2], [2, 3, -1]])
+
+    da = xr.DataArray(
+        np.array([[0, 1, 2], [2, 3, -999]]),
+        dims=("face", "nmax"),
+        attrs={"_FillValue": -999},
+    )
+    actual = xugrid.Ugrid2d._prepare_connectivity(da, -1, dtype=np.int64)
+    assert np.array_equal(actual, [[0, 1, 2], [2, 3, -1]])
+
+    # Fill value of a different type than the int32 data.
+    da = xr.DataArray(
+        np.array([[0, 1, 2], [2, 3, -999]], dtype=np.int32),
+        dims=("face", "nmax"),
+        attrs={"_FillValue": -999.0},
+    )
+    actual = xugrid.Ugrid2d._prepare_connectivity(da, -1, dtype=np.int64)
+    assert actual.dtype == np.int64
+    assert np.array_equal(actual, [[0, 1, 2], [2, 3, -1]])
+
+    # Fill value that the int16 data cannot represent: no fill entries.
+    da = xr.DataArray(
+        np.array([[0, 1, 2], [2, 3, 4]], dtype=np.int16),
+        dims=("face", "nmax"),
+        attrs={"_FillValue": 99999},
+    )
+    actual = xugrid.Ugrid2d._prepare_connectivity(da, -1, dtype=np.int64)
+    assert np.array_equal(actual, [[0, 1, 2], [2, 3, 4]])
+    da.attrs["_FillValue"] = 3.5
+    actual = xugrid.Ugrid2d._prepare_connectivity(da, -1, dtype=np.int64)
+    assert np.array_equal(actual, [[0, 1, 2], [2, 3, 4]])
+
+    da = xr.DataArray(np.array([[0.0, 1.0, 2.0], [2.0, -3.0, np.nan]]))
+    with pytest.raises(ValueError, match="connectivity contains negative values"):
+        xugrid.Ugrid2d._prepare_connectivity(da, -1, dtype=np.int64)
+
+
 @pytest.mark.parametrize("edge_start_index", [0, 1])
 @pytest.mark.parametrize("face_start_index", [0, 1])
 def test_ugrid2d_from_dataset__different_start_index(
@@ -484,6 +592,7 @@ def test_clear_geometry_properties():
         "_ymax",
         "_edge_x",
         "_edge_y",
+        "_fingerprint",
         "_triangulation",
         "_voronoi_topology",
         "_centroid_triangulation",
@@ -493,6 +602,44 @@ def test_clear_geometry_properties():
         assert getattr(grid, attr) is None
 
 
+def test_bounds_cache():
+    grid = xugrid.Ugrid2d(
+        node_x=VERTICES[:, 0].astype(np.float32),
+        node_y=VERTICES[:, 1].astype(np.float32),
+        fill_value=-1,
+        face_node_connectivity=FACES,
+    )
+    bounds = grid.bounds
+    assert bounds == (0.0, 0.0, 2.0, 2.0)
+    assert all(type(value) is np.float32 for value in bounds)
+
+    grid._clear_geometry_properties()
+    assert grid._xmin is None
+    assert grid._ymin is None
+    assert grid._xmax is None
+    assert grid._ymax is None
+
+    grid.node_x = grid.node_x + 1.0
+    grid.node_y = grid.node_y - 1.0
+    grid._clear_geometry_properties()
+    assert grid.bounds == (1.0, -1.0, 3.0, 1.0)
+
+    # NaN values propagate, as in node_x.min().
+    grid.node_x = grid.node_x.copy()
+    grid.node_x[0] = np.nan
+    grid._clear_geometry_properties()
+    xmin, ymin, xmax, ymax = grid.bounds
+    assert np.isnan(xmin)
+    assert np.isnan(xmax)
+    assert (ymin, ymax) == (-1.0, 1.0)
+
+    grid.node_x = grid.node_x[:0]
+    grid.node_y = grid.node_y[:0]
+    grid._clear_geometry_properties()
+    with pytest.raises(ValueError, match="zero-size array"):
+        grid.bounds
+
+
 def test_topology_dimension():
     grid = grid2d()
     assert grid.topology_dimension == 2
@@ -768,6 +915,13 @@ def test_rasterize():
     assert np.allclose(y, [1.75, 1.25, 0.75, 0.25, -0.25, -0.75])
     assert np.array_equal(index, expected_index)
 
+    # Snapping float32 bounds in float32 precision would lose a cell here.
+    bounds = np.array([1.0e5, 0.0, 1.0e5 + 0.046875, 0.046875], dtype=np.float32)
+    x, y, _ = grid.rasterize(resolution=0.01, bounds=tuple(bounds))
+    assert x.size == 5
+    assert y.size == 5
+    assert np.allclose(x, 1.0e5 + np.arange(0.005, 0.05, 0.01))
+
 
 class TestUgrid2dSelection:
     @pytest.fixture(autouse=True)
@@ -801,6 +955,15 @@ class TestUgrid2dSelection:
         )
         assert expected.equals(actual)
 
+        # The coordinates have the common dtype of x and y, and do not share
+        # memory with the input.
+        x = np.array([0.5, 1.5])
+        y = np.array([0, 1])
+        actual = self.grid.sel_points(obj=self.obj, x=x, y=y, out_of_bounds="drop")
+        assert actual[f"{NAME}_x"].dtype == np.float64
+        assert actual[f"{NAME}_y"].dtype == np.float64
+        assert not np.shares_memory(actual[f"{NAME}_x"].to_numpy(), x)
+
     def test_sel_points_out_of_bounds(self):
         x = [-10.0, 0.5, -20.0, 1.5, -30.0]
         y = [-10.0, 0.5, -20.0, 1.25, -30.0]
@@ -1074,6 +1237,28 @@ def test_topology_subset():
     assert actual.node_dimension == "nNetNode"
 
 
+def test_topology_subset_return_index():
+    grid = grid2d()
+    # The fill values of the triangles must not be selected as nodes.
+    face_index = np.array([3, 2])
+    actual, indexes = grid.topology_subset(face_index, return_index=True)
+    node_index = indexes[grid.node_dimension].to_numpy()
+    edge_index = indexes[grid.edge_dimension].to_numpy()
+    assert np.array_equal(node_index, [3, 4, 5, 6])
+    assert np.array_equal(
+        edge_index, np.unique(grid.face_edge_connectivity[face_index][:, :3])
+    )
+    assert np.array_equal(actual.node_x, grid.node_x[node_index])
+    assert np.array_equal(
+        actual.edge_node_coordinates, grid.edge_node_coordinates[edge_index]
+    )
+    assert np.array_equal(
+        actual.face_node_coordinates,
+        grid.face_node_coordinates[face_index],
+        equal_nan=True,
+    )
+
+
 def test_reindex_like():
     grid = grid2d()
     # Change face and edge_index.
@@ -1595,6 +1780,17 @@ def test_equals():
     grid_copy._attrs["attr"] = "something_else"
     assert not grid.equals(grid_copy)
 
+    # Rejected by the fingerprint, without comparing the datasets.
+    moved = grid2d()
+    moved.node_x = moved.node_x + 1.0
+    moved._clear_geometry_properties()
+    assert not grid.equals(moved)
+    assert grid._fingerprint is not None
+    # Signed zero and NaN do not affect the fingerprint.
+    assert xugrid.ugrid.ugridbase.fingerprint(
+        np.array([0.0, np.nan])
+    ) == xugrid.ugrid.ugridbase.fingerprint(np.array([-0.0, -np.nan]))
+
 
 def test_earcut_triangulate_polygons():
     with pytest.raises(TypeError):
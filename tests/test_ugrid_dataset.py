@@ -280,6 +280,17 @@ class TestUgridDataArray:
         assert np.allclose(actual["x"], x)
         assert np.allclose(actual["y"], y)
 
+        # Fully inside the grid: nothing is masked, dtype is always float.
+        x = [0.25, 0.75]
+        y = [0.75, 0.25]
+        da = xr.DataArray(np.empty((2, 2)), {"y": y, "x": x}, ["y", "x"])
+        actual = self.uda.ugrid.rasterize_like(other=da)
+        assert actual.shape == (2, 2)
+        assert actual.notnull().all()
+        assert actual.dtype == float
+        actual = (self.uda.astype(int)).ugrid.rasterize_like(other=da)
+        assert actual.dtype == float
+
     def test_partitioning(self):
         partitions = self.uda.ugrid.partition(n_part=2)
         assert len(partitions) == 2
@@ -1,5 +1,5 @@
 import abc
-from typing import Tuple, Union
+from typing import Union
 
 import numpy as np
 import xarray as xr
@@ -74,27 +74,25 @@ class AbstractUgridAccessor(abc.ABC):
     def topology(self):
         pass
 
-    @staticmethod
-    def _raster_xy(bounds: Tuple[float, float, float, float], resolution: float):
-        xmin, ymin, xmax, ymax = bounds
-        d = abs(resolution)
-        xmin = np.floor(xmin / d) * d
-        xmax = np.ceil(xmax / d) * d
-        ymin = np.floor(ymin / d) * d
-        ymax = np.ceil(ymax / d) * d
-        x = np.arange(xmin + 0.5 * d, xmax, d)
-        y = np.arange(ymax - 0.5 * d, ymin, -d)
-        return x, y
-
     def _raster(self, x, y, index) -> xr.DataArray:
-        index = index.ravel()
+        # index is generally already shaped (y.size, x.size): reshape is a
+        # no-op then, while ravel would copy a non-contiguous input.
         indexer = xr.DataArray(
-            data=index.reshape(y.size, x.size),
+            data=index.reshape((y.size, x.size)),
             coords={"y": y, "x": x},
             dims=["y", "x"],
         )
-        out = self.obj.isel({self.grid.face_dimension: indexer}).where(indexer != -1)
-        return out
+        out = self.obj.isel({self.grid.face_dimension: indexer})
+        inside = index != -1
+        if inside.all():
+            # Nothing to mask: only call where if it would still change the
+            # dtype (promotion to float) or broadcast a variable to (y, x).
+            variables = out.data_vars.values() if isinstance(out, xr.Dataset) else [out]
+            if all(
+                v.dtype.kind == "f" and {"y", "x"}.issubset(v.dims) for v in variables
+            ):
+                return out
+        return out.where(indexer.copy(data=inside))
 
     def clip_box(
         self,
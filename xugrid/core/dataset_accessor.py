@@ -276,8 +276,9 @@ class UgridDatasetAccessor(AbstractUgridAccessor):
         rasterized: xr.Dataset
         """
         datasets = []
+        bounds = self.total_bounds
         for grid in self.grids:
-            xx, yy, index = grid.rasterize(resolution, self.total_bounds)
+            xx, yy, index = grid.rasterize(resolution, bounds)
             datasets.append(self._raster(xx, yy, index))
         return xr.merge(datasets)
 
@@ -4,7 +4,6 @@ import functools
 
 import numpy as np
 
-from xugrid.constants import FloatDType
 from xugrid.plot.utils import (
     _add_colorbar,
     _easy_facetgrid,
@@ -388,15 +387,7 @@ def line(grid, da, ax, **kwargs):
     else:
         dim = None
 
-    edge_nodes = grid.edge_node_connectivity
-    n_edge = len(edge_nodes)
-    edge_coords = np.empty((n_edge, 2, 2), dtype=FloatDType)
-    node_0 = edge_nodes[:, 0]
-    node_1 = edge_nodes[:, 1]
-    edge_coords[:, 0, 0] = grid.node_x[node_0]
-    edge_coords[:, 0, 1] = grid.node_y[node_0]
-    edge_coords[:, 1, 0] = grid.node_x[node_1]
-    edge_coords[:, 1, 1] = grid.node_y[node_1]
+    edge_coords = grid.edge_node_coordinates
 
     # PolyCollection takes a norm, but not vmin, vmax.
     norm = kwargs.get("norm", None)
@@ -91,7 +91,7 @@ def _find_indices(side):
             out[i] = minmax(sorter[lo] + add, 0, a.size)
         return
 
-    @numba.njit
+    @numba.njit(parallel=True)
     def find_indices(
         source,
         target,
@@ -121,16 +121,23 @@ def _find_indices(side):
         """
         _, n = source.shape
         _, m = target.shape
+        n_index = source_index.size
         # Will contain the index along dimension m.
-        indices = np.full((source_index.size, m), -1, dtype=IntDType)
-        sorter = np.empty(n, IntDType)
-        nan_helper = np.empty(n, source.dtype)
-        for k, (i, j) in enumerate(zip(source_index, target_index)):
-            source_i = source[i, :]
-            target_j = target[j, :]
-            preallocated_searchsorted(
-                source_i, target_j, indices[k], nan_helper, sorter
-            )
+        indices = np.full((n_index, m), -1, dtype=IntDType)
+        # Every column is independent. Divide them in blocks, one per thread,
+        # so that the scratch arrays are allocated once per block.
+        n_block = min(numba.get_num_threads(), n_index)
+        for block in numba.prange(n_block):
+            start = (block * n_index) // n_block
+            end = ((block + 1) * n_index) // n_block
+            sorter = np.empty(n, IntDType)
+            nan_helper = np.empty(n, source.dtype)
+            for k in range(start, end):
+                source_i = source[source_index[k], :]
+                target_j = target[target_index[k], :]
+                preallocated_searchsorted(
+                    source_i, target_j, indices[k], nan_helper, sorter
+                )
         return indices
 
     return find_indices
@@ -7,12 +7,14 @@ While the unstructured logic would work for structured data as well, it is much
 less efficient than utilizing the structure of the coordinates.
 """
 
-from typing import Any, Tuple, Union
+import weakref
+from typing import Any, Dict, Tuple, Union
 
+import numba as nb
 import numpy as np
 import xarray as xr
 
-from xugrid.constants import FloatArray, IntArray
+from xugrid.constants import FloatArray, FloatDType, IntArray, IntDType
 from xugrid.regrid.overlap_1d import overlap_1d, overlap_1d_nd
 from xugrid.regrid.unstructured import UnstructuredGrid2d
 from xugrid.regrid.utils import broadcast
@@ -21,6 +23,246 @@ from xugrid.ugrid.ugrid2d import Ugrid2d
 # from xugrid import Ugrid2d
 
 
+@nb.njit(inline="always", cache=True)
+def _searchsorted(a, v, side_right):
+    lo = 0
+    hi = a.size
+    while hi > lo:
+        mid = (lo + hi) >> 1
+        if a[mid] < v or (side_right and a[mid] == v):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@nb.njit(parallel=True, cache=True)
+def _valid_nodes(midpoints, lower, upper, side_right):
+    """
+    Find the cell of (lower, upper) that contains each midpoint.
+
+    Fuses both binary searches and the validity check in a single pass.
+    Located indices are compacted in a second (serial) pass.
+
+    Returns
+    -------
+    located_index: np.ndarray of int
+        Index into lower and upper.
+    midpoint_index: np.ndarray of int
+        Index into midpoints.
+    """
+    n = midpoints.size
+    lower_bound = lower[0]
+    upper_bound = upper[-1]
+    located = np.empty(n, dtype=IntDType)
+    for i in nb.prange(n):
+        v = midpoints[i]
+        start = _searchsorted(lower, v, side_right)
+        end = _searchsorted(upper, v, side_right)
+        if (start == (end + 1)) and (v > lower_bound) and (v < upper_bound):
+            located[i] = end
+        else:
+            located[i] = -1
+
+    n_valid = 0
+    for i in range(n):
+        if located[i] != -1:
+            n_valid += 1
+
+    located_index = np.empty(n_valid, dtype=IntDType)
+    midpoint_index = np.empty(n_valid, dtype=IntDType)
+    k = 0
+    for i in range(n):
+        if located[i] != -1:
+            located_index[k] = located[i]
+            midpoint_index[k] = i
+            k += 1
+    return located_index, midpoint_index
+
+
+@nb.njit(cache=True)
+def _classify(x, rtol):
+    """
+    Check monotonicity and equidistance of x in a single pass.
+
+    The reference step is the first step in ascending order: the first step
+    for increasing values, the last step for decreasing values.
+
+    Returns
+    -------
+    increasing: bool
+    decreasing: bool
+    equidistant: bool
+        Whether all steps are within 1.0e-8 + rtol * step * step of the
+        reference step.
+    step: float
+        Absolute value of the reference step.
+    """
+    n = x.size
+    if n < 2:
+        return True, True, False, np.nan
+
+    if x[1] < x[0]:
+        step = x[n - 1] - x[n - 2]
+    else:
+        step = x[1] - x[0]
+    step = abs(step)
+    # As np.allclose(steps, step, rtol * step): the relative tolerance scales
+    # with the step itself, plus the default absolute tolerance of allclose.
+    tolerance = 1.0e-8 + rtol * step * step
+
+    increasing = True
+    decreasing = True
+    equidistant = True
+    for i in range(n - 1):
+        d = x[i + 1] - x[i]
+        # NaN values will make both False.
+        if not d >= 0:
+            increasing = False
+        if not d <= 0:
+            decreasing = False
+        if abs(abs(d) - step) > tolerance:
+            equidistant = False
+    return increasing, decreasing, equidistant, step
+
+
+@nb.njit(parallel=True, cache=True)
+def _linear_weights(
+    source_midpoints,
+    target_midpoints,
+    source_index,
+    target_index,
+    source_flipped,
+    target_flipped,
+):
+    """
+    Compute the linear interpolation weights between the source midpoint
+    containing each target midpoint and its neighbor in the direction of the
+    target midpoint.
+
+    Every target gets a pair of entries: (source, weight) and (neighbor,
+    1 - weight). When the neighbor falls outside of the source domain, the
+    source itself is used as the neighbor, with all weight on it.
+
+    Indexes are in the (possibly descending) order of the original coordinate,
+    midpoints are always ascending.
+    """
+    n = source_midpoints.size
+    m = target_midpoints.size
+    n_out = 2 * source_index.size
+    source_out = np.empty(n_out, dtype=IntDType)
+    target_out = np.empty(n_out, dtype=IntDType)
+    weights_out = np.empty(n_out, dtype=np.float64)
+    for i in nb.prange(source_index.size):
+        s = source_index[i]
+        t = target_index[i]
+        ii = n - s - 1 if source_flipped else s
+        jj = m - t - 1 if target_flipped else t
+        source_x = source_midpoints[ii]
+        target_x = target_midpoints[jj]
+        # When we exceed the original domain, it should still interpolate
+        # within the bounds: make sure the neighbor falls in [0, n).
+        if target_x <= source_x:
+            neighbor = max(ii - 1, 0)
+        else:
+            neighbor = min(ii + 1, n - 1)
+
+        # If the neighbor is the source itself, we'd compute zero distance.
+        # Instead, put all weight on it.
+        if neighbor == ii:
+            weight = 0.0
+        else:
+            total_length = source_midpoints[neighbor] - source_x
+            # Do not divide by zero.
+            if total_length == 0:
+                total_length = 1.0
+            weight = 1.0 - (target_x - source_x) / total_length
+            weight = min(max(weight, 0.0), 1.0)
+
+        k = 2 * i
+        source_out[k] = s
+        source_out[k + 1] = n - neighbor - 1 if source_flipped else neighbor
+        target_out[k] = t
+        target_out[k + 1] = t
+        weights_out[k] = weight
+        weights_out[k + 1] = 1.0 - weight
+    return source_out, target_out, weights_out
+
+
+@nb.njit(inline="always", cache=True)
+def _searchsorted_equidistant(a, v, da, side_right):
+    """
+    Searchsorted on the first a.size - 1 values of a, matching the search
+    bounds of overlap_1d. The index is estimated from the (equidistant) step
+    da, then corrected for any drift by walking.
+    """
+    n = a.size - 1
+    k = int(np.floor((v - a[0]) / da)) + 1
+    k = min(max(k, 0), n)
+    if side_right:
+        while k > 0 and a[k - 1] > v:
+            k -= 1
+        while k < n and a[k] <= v:
+            k += 1
+    else:
+        while k > 0 and a[k - 1] >= v:
+            k -= 1
+        while k < n and a[k] < v:
+            k += 1
+    return k
+
+
+@nb.njit(parallel=True, cache=True)
+def _overlap_equidistant(
+    source_lower, source_upper, target_lower, target_upper, source_dx
+):
+    """
+    Compute the overlap of two ascending, equidistant sets of cells.
+
+    Equivalent to overlap_1d, but the range of source cells for every target
+    cell is computed directly from the source cell size, rather than by binary
+    searches. Only pairs with a positive overlap are returned.
+    """
+    n = source_lower.size
+    m = target_lower.size
+    start = np.empty(m, dtype=IntDType)
+    end = np.empty(m, dtype=IntDType)
+    count = np.zeros(m, dtype=IntDType)
+    for j in nb.prange(m):
+        lower = target_lower[j]
+        upper = target_upper[j]
+        i0 = _searchsorted_equidistant(source_lower, lower, source_dx, True) - 1
+        i1 = _searchsorted_equidistant(source_upper, upper, source_dx, False) + 1
+        i0 = min(max(i0, 0), n)
+        i1 = min(max(i1, 0), n)
+        start[j] = i0
+        end[j] = i1
+        for i in range(i0, i1):
+            if min(upper, source_upper[i]) - max(lower, source_lower[i]) > 0.0:
+                count[j] += 1
+
+    offset = np.empty(m + 1, dtype=IntDType)
+    offset[0] = 0
+    for j in range(m):
+        offset[j + 1] = offset[j] + count[j]
+    n_total = offset[m]
+    source_index = np.empty(n_total, dtype=IntDType)
+    target_index = np.empty(n_total, dtype=IntDType)
+    weights = np.empty(n_total, dtype=np.float64)
+    for j in nb.prange(m):
+        lower = target_lower[j]
+        upper = target_upper[j]
+        k = offset[j]
+        for i in range(start[j], end[j]):
+            overlap = min(upper, source_upper[i]) - max(lower, source_lower[i])
+            if overlap > 0.0:
+                source_index[k] = i
+                target_index[k] = j
+                weights[k] = overlap
+                k += 1
+    return source_index, target_index, weights
+
+
 class StructuredGrid1d:
     """
     e.g. z -> z; so also works for unstructured
@@ -35,47 +277,64 @@ class StructuredGrid1d:
         size_name = f"d{name}"  # e.g. dx
 
         index = obj.indexes[name]
+        values = index.to_numpy()
+        increasing, decreasing, equidistant, step = _classify(values, 1.0e-4)
         # take care of potentially decreasing coordinate values
-        if index.is_monotonic_decreasing:
-            midpoints = index.to_numpy()[::-1]
+        if decreasing:
+            midpoints = values[::-1]
             flipped = True
             side = "right"
-        elif index.is_monotonic_increasing:
-            midpoints = index.to_numpy()
+        elif increasing:
+            midpoints = values
             flipped = False
             side = "left"
         else:
             raise ValueError(f"{name} is not monotonic for array {obj.name}")
 
+        # Only cells derived from equidistant midpoints are known to be regular.
+        regular = False
         if bounds_name in obj.coords:
             bounds = obj[bounds_name].to_numpy()
-            size = bounds[:, 1] - bounds[:, 0]
+            lower = bounds[:, 0]
+            upper = bounds[:, 1]
+            size = upper - lower
         else:
             if size_name in obj.coords:
                 # works for scalar size and array size
                 size = obj[size_name].to_numpy()
             else:
                 # no bounds defined, no dx defined
-                # make an estimate of cell size
-                size = np.diff(midpoints)
-                # Check if equidistant
-                atolx = 1.0e-4 * size[0]
-                if not np.allclose(size, size[0], atolx):
+                # use the (equidistant) cell size
+                if not equidistant:
                     raise ValueError(
                         f"DataArray has to be equidistant along {name}, or "
                         f'explicit bounds must be given as "{name}bounds", or '
                         f'cellsizes must be as "d{name}"'
                     )
-                size = np.full_like(midpoints, size[0])
+                size = np.full_like(midpoints, step)
+                regular = step > 0
 
             abs_size = np.abs(size)
-            start = midpoints - 0.5 * abs_size
-            end = midpoints + 0.5 * abs_size
-            bounds = np.column_stack((start, end))
+            lower = midpoints - 0.5 * abs_size
+            upper = midpoints + 0.5 * abs_size
 
         self.name = name
-        self.midpoints = midpoints
-        self.bounds = bounds
+        # Store the midpoints, lower and upper bounds as separate contiguous
+        # float arrays: the binary searches operate on a single column at a
+        # time, and are much slower on strided (e.g. reversed, or (n, 2)
+        # column) views or on mismatched dtypes. This also ensures the numba
+        # kernels are compiled for a single signature.
+        self.midpoints = np.ascontiguousarray(midpoints, dtype=FloatDType)
+        self.lower = np.ascontiguousarray(lower, dtype=FloatDType)
+        self.upper = np.ascontiguousarray(upper, dtype=FloatDType)
+        self._size = self.lower.size
+        self._length = np.abs(self.upper - self.lower)
+        # Zero length cells never overlap, so their (infinite) reciprocal is
+        # never used.
+        with np.errstate(divide="ignore"):
+            self._inv_length = 1.0 / self._length
+        self.equidistant = regular
+        self.dx = step
         self.flipped = flipped
         self.side = side
         self.dname = size_name
@@ -99,13 +358,17 @@ class StructuredGrid1d:
     def dims(self) -> Tuple[str]:
         return (self.name,)
 
+    @property
+    def bounds(self) -> FloatArray:
+        return np.column_stack((self.lower, self.upper))
+
     @property
     def size(self) -> int:
-        return len(self.bounds)
+        return self._size
 
     @property
     def length(self) -> FloatArray:
-        return np.squeeze(abs(np.diff(self.bounds, axis=1)))
+        return self._length
 
     @property
     def directional_bounds(self):
@@ -142,15 +405,12 @@ class StructuredGrid1d:
         valid_other_index: np.array
             valid target indexes
         """
-        start = np.searchsorted(self.bounds[:, 0], other.midpoints, side=self.side)
-        end = np.searchsorted(self.bounds[:, 1], other.midpoints, side=self.side)
-        valid = (
-            (start == (end + 1))
-            & (other.midpoints > self.bounds[0, 0])
-            & (other.midpoints < self.bounds[-1, 1])
-        )
-        valid_other_index = np.arange(other.size)[valid]
-        valid_self_index = end[valid]
+        valid_self_index, valid_other_index = _valid_nodes(
+            other.midpoints,
+            self.lower,
+            self.upper,
+            self.side == "right",
+        )
         valid_self_index = self.flip_if_needed(valid_self_index)
         valid_other_index = other.flip_if_needed(valid_other_index)
         return valid_self_index, valid_other_index
@@ -160,9 +420,10 @@ class StructuredGrid1d:
     ) -> Tuple[IntArray, IntArray]:
         """
         Return all valid nodes for linear interpolation.
-        In addition to valid_nodes_within_bounds() is checked if target
-        midpoints are not outside outer source boundary midpoints. In that case
-        there is no interpolation possible.
+
+        These are the same nodes as valid_nodes_within_bounds(): target
+        midpoints outside of the outer source midpoints (but within the source
+        bounds) are kept, the linear weights clip their neighbor to the domain.
 
         Parameters
         ----------
@@ -176,12 +437,7 @@ class StructuredGrid1d:
         valid_other_index: np.array
             valid target indexes
         """
-        source_index, target_index = self.valid_nodes_within_bounds(other)
-        return source_index, target_index
-        valid = (other.midpoints[target_index] > self.midpoints[0]) & (
-            other.midpoints[target_index] < self.midpoints[-1]
-        )
-        return source_index[valid], target_index[valid]
+        return self.valid_nodes_within_bounds(other)
 
     def overlap_1d_structured(
         self, other: "StructuredGrid1d"
@@ -204,48 +460,16 @@ class StructuredGrid1d:
         weights: np.array
             length of overlap
         """
-        source_index, target_index, weights = overlap_1d(self.bounds, other.bounds)
+        if self.equidistant and other.equidistant:
+            source_index, target_index, weights = _overlap_equidistant(
+                self.lower, self.upper, other.lower, other.upper, self.dx
+            )
+        else:
+            source_index, target_index, weights = overlap_1d(self.bounds, other.bounds)
         source_index = self.flip_if_needed(source_index)
         target_index = other.flip_if_needed(target_index)
         return source_index, target_index, weights
 
-    def centroids_to_linear_sets(
-        self,
-        source_index: np.array,
-        target_index: np.array,
-        weights: np.array,
-        neighbour: np.array,
-    ) -> Tuple[IntArray, IntArray, FloatArray]:
-        """
-        Return for every target node an pair of connected source nodes based
-        on centroids connection inputs.
-
-        Parameters
-        ----------
-        source_index: np.array
-        target_index: np.array
-        weights: np.array
-
-        Returns
-        -------
-        valid_self_index: np.array
-        valid_other_index: np.array
-        weights: np.array
-            lineair interpolation weights.
-        """
-        # if source_index is flipped, source-index is decreasing and neighbour
-        # need to be flipped
-        if self.flipped:
-            neighbour = -neighbour
-        source_index = np.column_stack((source_index, source_index + neighbour)).ravel()
-        target_index = np.repeat(target_index, 2)
-        weights = np.column_stack((weights, 1.0 - weights)).ravel()
-
-        # correct for possibility of out of bound due to column-stack
-        # source_index + 1 and -1
-        valid = np.logical_and(source_index <= self.size - 1, source_index >= 0)
-        return source_index[valid], target_index[valid], weights[valid]
-
     def maybe_reverse_index(self, index: IntArray) -> IntArray:
         """
         Flips the index if needed for descending coordinates.
@@ -263,76 +487,6 @@ class StructuredGrid1d:
         else:
             return index
 
-    def compute_linear_weights_to_centroids(
-        self, other: "StructuredGrid1d", source_index: IntArray, target_index: IntArray
-    ) -> Tuple[FloatArray, IntArray]:
-        """
-        Compute linear weights bases on centroid indexes.
-
-        Parameters
-        ----------
-        other: StructuredGrid1d
-        source_index: np.array
-        target_index: np.array
-
-        Raises
-        ------
-        ValueError
-            When the coordinate contains only a single point.
-
-        Returns
-        -------
-        weights: np.array
-        neighbor: np.narray
-        """
-        if self.midpoints.size < 2:
-            raise ValueError(
-                f"Coordinate {self.name} has size: {self.midpoints.size}. "
-                "At least two points are required for interpolation."
-            )
-
-        source_midpoint_index = self.maybe_reverse_index(source_index)
-        target_midpoint_index = other.maybe_reverse_index(target_index)
-        # cases where midpoint target <= midpoint source: set neighbor to -1
-        neighbor = np.where(
-            other.midpoints[target_midpoint_index]
-            <= self.midpoints[source_midpoint_index],
-            -1,
-            1,
-        )
-
-        # When we exceed the original domain, it should still interpolate
-        # within the bounds.
-        # Make sure neighbor falls in [0, n)
-        neighbor_index = np.clip(
-            source_midpoint_index + neighbor, 0, self.midpoints.size - 1
-        )
-        # Update neighbor since we return it
-        neighbor = neighbor_index - source_midpoint_index
-
-        # If neighbor is 0, we end up computing zero distance, since we're
-        # comparing a midpoint to iself. Instead, set a weight of 1.0 on one,
-        # (and impliclity 0 in the other). Similarly, if source and target
-        # midpoints coincide, the distance may end up 0.
-        length = (
-            other.midpoints[target_midpoint_index]
-            - self.midpoints[source_midpoint_index]
-        )
-        total_length = (
-            self.midpoints[neighbor_index] - self.midpoints[source_midpoint_index]
-        )
-        # Do not divide by zero.
-        # We will overwrite the value anyway at neighbor == 0.
-        total_length[total_length == 0] = 1
-        weights = 1 - (length / total_length)
-        weights[neighbor == 0] = 0.0
-        condition = np.logical_and(weights < 0.0, weights > 1.0)
-        if condition.any():
-            raise ValueError(
-                f"Computed invalid weights for dimensions: {self.name} at coords: {self.midpoints[condition]}"
-            )
-        return weights, neighbor
-
     def sorted_output(
         self, source_index: IntArray, target_index: IntArray, weights: FloatArray
     ) -> Tuple[IntArray, IntArray, FloatArray]:
@@ -380,7 +534,7 @@ class StructuredGrid1d:
         """
         source_index, target_index, weights = self.overlap_1d_structured(other)
         if relative:
-            weights /= self.length[source_index]
+            weights *= self._inv_length[source_index]
         return self.sorted_output(source_index, target_index, weights)
 
     def locate_centroids(
@@ -421,15 +575,19 @@ class StructuredGrid1d:
         target_index: np.array
         weights: np.array
         """
+        if self.midpoints.size < 2:
+            raise ValueError(
+                f"Coordinate {self.name} has size: {self.midpoints.size}. "
+                "At least two points are required for interpolation."
+            )
         source_index, target_index = self.valid_nodes_within_bounds_and_extend(other)
-        weights, neighbour = self.compute_linear_weights_to_centroids(
-            other, source_index, target_index
-        )
-        source_index, target_index, weights = self.centroids_to_linear_sets(
+        source_index, target_index, weights = _linear_weights(
+            self.midpoints,
+            other.midpoints,
             source_index,
             target_index,
-            weights,
-            neighbour,
+            self.flipped,
+            other.flipped,
         )
         return self.sorted_output(source_index, target_index, weights)
 
@@ -450,6 +608,39 @@ class StructuredGrid1d:
         )
 
 
+# Cache of StructuredGrid1d objects, keyed on the id of the (immutable) pandas
+# index and the coordinate name. A weak reference to the index removes the
+# entry when the index is garbage collected.
+_GRID1D_CACHE: Dict[Tuple[int, str], Tuple[weakref.ref, StructuredGrid1d]] = {}
+
+
+def _structured_grid_1d(
+    obj: Union[xr.DataArray, xr.Dataset], name: str
+) -> StructuredGrid1d:
+    """
+    Return a (possibly cached) StructuredGrid1d for coordinate name of obj.
+
+    Only grids derived purely from the index are cached: explicit bounds or
+    cell sizes are coordinates which may differ between objects sharing the
+    same index.
+    """
+    if f"{name}bounds" in obj.coords or f"d{name}" in obj.coords:
+        return StructuredGrid1d(obj, name)
+
+    index = obj.indexes[name]
+    key = (id(index), name)
+    entry = _GRID1D_CACHE.get(key)
+    if entry is not None:
+        ref, grid = entry
+        if ref() is index:
+            return grid
+
+    grid = StructuredGrid1d(obj, name)
+    ref = weakref.ref(index, lambda _: _GRID1D_CACHE.pop(key, None))
+    _GRID1D_CACHE[key] = (ref, grid)
+    return grid
+
+
 class StructuredGrid2d(StructuredGrid1d):
     """Represent e.g. raster data topology."""
 
@@ -459,8 +650,8 @@ class StructuredGrid2d(StructuredGrid1d):
         name_x: str,
         name_y: str,
     ):
-        self.xbounds = StructuredGrid1d(obj, name_x)
-        self.ybounds = StructuredGrid1d(obj, name_y)
+        self.xbounds = _structured_grid_1d(obj, name_x)
+        self.ybounds = _structured_grid_1d(obj, name_y)
 
     @property
     def coords(self) -> dict:
@@ -622,17 +813,22 @@ class StructuredGrid3d:
         name_y: str,
         name_z: str,
     ):
-        self.xbounds = StructuredGrid1d(obj, name_x)
-        self.ybounds = StructuredGrid1d(obj, name_y)
-        self.zbounds = StructuredGrid1d(obj, name_z)
+        self.xbounds = _structured_grid_1d(obj, name_x)
+        self.ybounds = _structured_grid_1d(obj, name_y)
+        self.zbounds = _structured_grid_1d(obj, name_z)
 
     @property
     def shape(self):
-        return (self.zbound.size, self.ybounds.size, self.xbounds.size)
+        return (self.zbounds.size, self.ybounds.size, self.xbounds.size)
 
     @property
     def volume(self):
-        return np.multiply.outer(self.zbounds.length, self.area)
+        # Multiply the smallest factors first: the (z, y) temporary is much
+        # smaller than an (y, x) area array.
+        return np.multiply.outer(
+            np.multiply.outer(self.zbounds.length, self.ybounds.length),
+            self.xbounds.length,
+        )
 
     def broadcast_sorted(
         self,
@@ -748,9 +944,9 @@ class ExplicitStructuredGrid3d:
         obj: Union[xr.DataArray, xr.Dataset],
     ):
         # zbounds is a 3D array with dimensions (nlayer, y.size * x.size, 2)
-        self.xbounds = StructuredGrid1d(obj, "x")
-        self.ybounds = StructuredGrid1d(obj, "y")
-        self.zbounds = StructuredGrid1d(obj, "z")
+        self.xbounds = _structured_grid_1d(obj, "x")
+        self.ybounds = _structured_grid_1d(obj, "y")
+        self.zbounds = _structured_grid_1d(obj, "z")
 
     @property
     def shape(self):
@@ -100,7 +100,9 @@ class UnstructuredGrid2d:
         if isinstance(self, matched_type):
             return self
         else:
-            TypeError(f"Cannot convert UnstructuredGrid2d to {matched_type.__name__}")
+            raise TypeError(
+                f"Cannot convert UnstructuredGrid2d to {matched_type.__name__}"
+            )
 
     def overlap(self, other, relative: bool):
         """
@@ -133,9 +135,10 @@ class UnstructuredGrid2d:
     def locate_centroids(self, other, tolerance: Optional[float] = None):
         tree = self.ugrid_topology.celltree
         source_index = tree.locate_points(other.ugrid_topology.centroids, tolerance)
-        inside = source_index != -1
-        source_index = source_index[inside]
-        target_index = np.arange(other.size, dtype=source_index.dtype)[inside]
+        target_index = np.flatnonzero(source_index != -1).astype(
+            source_index.dtype, copy=False
+        )
+        source_index = source_index[target_index]
         weight_values = np.ones_like(source_index, dtype=FloatDType)
         return source_index, target_index, weight_values
 
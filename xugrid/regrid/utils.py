@@ -2,15 +2,23 @@ import numpy as np
 
 
 def create_linear_index(arrays, dims):
-    meshgrids = [a.ravel() for a in np.meshgrid(*arrays, indexing="ij")]
-    return np.ravel_multi_index(meshgrids, dims)
+    """
+    Compute the linear index of every combination of the per-dimension
+    indices, in C order.
+
+    Uses Horner's scheme with outer additions rather than materializing a
+    meshgrid per dimension and calling np.ravel_multi_index.
+    """
+    index = np.asarray(arrays[0])
+    for a, dim in zip(arrays[1:], dims[1:]):
+        index = np.add.outer(index * dim, np.asarray(a))
+    return index.ravel()
 
 
 def create_weights(arrays):
-    meshgrids = np.meshgrid(*arrays, indexing="ij")
-    weight = meshgrids[0]
-    for dim_weight in meshgrids[1:]:
-        weight *= dim_weight
+    weight = np.asarray(arrays[0])
+    for dim_weight in arrays[1:]:
+        weight = np.multiply.outer(weight, np.asarray(dim_weight))
     return weight.ravel()
 
 
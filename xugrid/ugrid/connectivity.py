@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from typing import NamedTuple, Tuple
 
 import numba as nb
@@ -227,20 +228,17 @@ def contract_vertices(A: sparse.csr_matrix, indices: IntArray) -> IntArray:
 
 # Conversion between dense and sparse
 # -----------------------------------
-def _to_ij(conn: IntArray, invert: bool) -> Tuple[IntArray, IntArray]:
+def _to_ij(conn: IntArray) -> Tuple[IntArray, IntArray]:
     n, m = conn.shape
     j = conn.ravel()
     valid = j != FILL_VALUE
     i = np.repeat(np.arange(n), m)[valid]
     j = j[valid]
-    if invert:
-        return j, i
-    else:
-        return i, j
+    return i, j
 
 
-def _to_sparse(conn: IntArray, invert: bool, sort_indices: bool) -> sparse.csr_matrix:
-    i, j = _to_ij(conn, invert)
+def _to_sparse(conn: IntArray, sort_indices: bool) -> sparse.csr_matrix:
+    i, j = _to_ij(conn)
     coo_content = (j, (i, j))
     coo_matrix = sparse.coo_matrix(coo_content)
     csr_matrix = coo_matrix.tocsr()
@@ -281,7 +279,7 @@ def ragged_index(n: int, m: int, m_per_row: IntArray) -> BoolArray:
 
 
 def to_sparse(conn: IntArray, sort_indices: bool = True) -> sparse.csr_matrix:
-    return _to_sparse(conn, invert=False, sort_indices=sort_indices)
+    return _to_sparse(conn, sort_indices=sort_indices)
 
 
 def to_dense(conn: SparseMatrix, n_columns: int = None) -> IntArray:
@@ -317,14 +315,68 @@ def to_dense(conn: SparseMatrix, n_columns: int = None) -> IntArray:
 
 # Inverting connectivities
 # ------------------------
-def invert_dense_to_sparse(
-    conn: IntArray, sort_indices: bool = True
-) -> sparse.csr_matrix:
-    return _to_sparse(conn, invert=True, sort_indices=sort_indices)
+@nb.njit(cache=True)
+def _invert_to_csr(conn: IntArray, n_row: int) -> Tuple[IntArray, IntArray, int]:
+    n, m = conn.shape
+    # Count the entries per row of the inverse, skipping fill values.
+    indptr = np.zeros(n_row + 1, dtype=IntDType)
+    n_column = 0
+    for i in range(n):
+        for k in range(m):
+            v = conn[i, k]
+            if v != FILL_VALUE:
+                indptr[v + 1] += 1
+                n_column = i + 1
+    for v in range(n_row):
+        indptr[v + 1] += indptr[v]
+    # Scatter the row numbers into the next free slot of their inverse row.
+    # Since the rows are visited in order, the column indices of every row of
+    # the inverse end up sorted.
+    position = indptr[:-1].copy()
+    indices = np.empty(indptr[-1], dtype=IntDType)
+    for i in range(n):
+        for k in range(m):
+            v = conn[i, k]
+            if v != FILL_VALUE:
+                indices[position[v]] = i
+                position[v] += 1
+    return indptr, indices, n_column
+
+
+def _invert_to_sparse(conn: IntArray) -> sparse.csr_matrix:
+    """
+    Invert a dense connectivity into CSR format directly, with a counting
+    pass for indptr and a scatter pass for the indices. This avoids the
+    intermediate (i, j) arrays and the COO to CSR conversion.
+    """
+    n_row = conn.max() + 1
+    indptr, indices, n_column = _invert_to_csr(conn, n_row)
+    csr_matrix = sparse.csr_matrix(
+        (indices.copy(), indices, indptr), shape=(n_row, n_column)
+    )
+    # Rows of conn with repeated values result in duplicate entries; sum them
+    # as the COO to CSR conversion would. This is a cheap check otherwise.
+    csr_matrix.sum_duplicates()
+    return csr_matrix
 
 
-def invert_dense(conn: IntArray, sort_indices: bool = True) -> IntArray:
-    sparse_inverted = _to_sparse(conn, invert=True, sort_indices=sort_indices)
+def _warn_sort_indices(sort_indices) -> None:
+    if sort_indices is not None:
+        warnings.warn(
+            "sort_indices has been deprecated and has no effect: the indices "
+            "of an inverted connectivity are always sorted.",
+            FutureWarning,
+        )
+
+
+def invert_dense_to_sparse(conn: IntArray, sort_indices=None) -> sparse.csr_matrix:
+    _warn_sort_indices(sort_indices)
+    return _invert_to_sparse(conn)
+
+
+def invert_dense(conn: IntArray, sort_indices=None) -> IntArray:
+    _warn_sort_indices(sort_indices)
+    sparse_inverted = _invert_to_sparse(conn)
     return to_dense(sparse_inverted)
 
 
@@ -357,6 +409,19 @@ def _renumber(a: IntArray) -> IntArray:
     return dense.reshape(a.shape)
 
 
+def unique_indices(a: IntArray, n: int) -> IntArray:
+    """
+    Return the sorted unique values of ``a``, excluding FILL_VALUE.
+
+    The values must lie within [0, n). A presence mask of size n replaces the
+    sort of np.unique: O(a.size + n) rather than O(a.size log a.size).
+    """
+    a = np.ravel(a)
+    present = np.zeros(n, dtype=bool)
+    present[a[a != FILL_VALUE]] = True
+    return np.flatnonzero(present)
+
+
 def renumber(a: IntArray):
     valid = a != FILL_VALUE
     renumbered = np.full_like(a, FILL_VALUE)
@@ -526,6 +591,28 @@ def node_node_connectivity(edge_node_connectivity: IntArray) -> sparse.csr_matri
     return coo_matrix.tocsr()
 
 
+def csr_rows(
+    indptr: IntArray, indices: IntArray, rows: IntArray
+) -> Tuple[IntArray, IntArray]:
+    """
+    Gather the column indices of the given rows of a CSR structure.
+
+    Equivalent to ``(A.getnnz(axis=1)[rows], A[rows].indices)`` for a
+    csr_matrix A, but operates on the raw indptr and indices arrays, and does
+    not construct an intermediate sparse matrix.
+
+    Returns
+    -------
+    n_per_row: np.ndarray of int
+    indices: np.ndarray of int
+    """
+    start = indptr[rows]
+    n_per_row = indptr[rows + 1] - start
+    offset = np.cumsum(n_per_row) - n_per_row
+    position = np.repeat(start - offset, n_per_row) + np.arange(n_per_row.sum())
+    return n_per_row, indices[position]
+
+
 def edge_edge_connectivity(
     edge_node_connectivity: IntArray,
     node_edge_connectivity: sparse.csr_matrix,
@@ -535,8 +622,9 @@ def edge_edge_connectivity(
     # - Filter self -> self away.
     n_edge = len(edge_node_connectivity)
     node_index = edge_node_connectivity.ravel()
-    j = node_edge_connectivity[node_index].indices
-    n_connection = node_edge_connectivity.getnnz(axis=1)[node_index]
+    n_connection, j = csr_rows(
+        node_edge_connectivity.indptr, node_edge_connectivity.indices, node_index
+    )
     # This way i comes pre-sorted in the COO constructor.
     i = np.repeat(np.arange(n_edge), n_connection.reshape((-1, 2)).sum(axis=1))
     is_connection = i != j
@@ -557,9 +645,10 @@ def directed_edge_edge_connectivity(
     # - Then filter self -> self away.
     n_edge = len(edge_node_connectivity)
     second_node = edge_node_connectivity[:, 1]
-    n_downstream = node_edge_connectivity.getnnz(axis=1)[second_node]
+    n_downstream, downstream_edges = csr_rows(
+        node_edge_connectivity.indptr, node_edge_connectivity.indices, second_node
+    )
     upstream_edges = np.repeat(np.arange(n_edge), n_downstream)
-    downstream_edges = node_edge_connectivity[second_node].indices
     node_index = np.repeat(second_node, n_downstream)
     valid = downstream_edges != upstream_edges
     return sparse.csr_matrix(
@@ -23,7 +23,7 @@ from xugrid.core.utils import either_dict_or_kwargs
 from xugrid.regrid.utils import alt_cumsum
 from xugrid.ugrid import connectivity, conventions
 from xugrid.ugrid.selection_utils import section_coordinates_1d
-from xugrid.ugrid.ugridbase import AbstractUgrid, as_pandas_index
+from xugrid.ugrid.ugridbase import AbstractUgrid, as_pandas_index, is_range_index
 
 
 class Ugrid1d(AbstractUgrid):
@@ -101,6 +101,8 @@ class Ugrid1d(AbstractUgrid):
         # Edges
         self._edge_x = None
         self._edge_y = None
+        # Fingerprint for equality checks
+        self._fingerprint = None
         # Connectivity
         self._node_node_connectivity = None
         self._node_edge_connectivity = None
@@ -194,6 +196,8 @@ class Ugrid1d(AbstractUgrid):
         # Edges
         self._edge_x = None
         self._edge_y = None
+        # Fingerprint for equality checks
+        self._fingerprint = None
 
     @classmethod
     def from_meshkernel(
@@ -592,12 +596,11 @@ class Ugrid1d(AbstractUgrid):
         if not isinstance(edge_index, pd.Index):
             edge_index = as_pandas_index(edge_index, self.n_edge)
 
-        range_index = pd.RangeIndex(0, self.n_edge)
-        if edge_index.size == self.n_edge and edge_index.equals(range_index):
+        if is_range_index(edge_index, self.n_edge):
             if return_index:
                 indexes = {
                     self.node_dimension: pd.RangeIndex(0, self.n_node),
-                    self.edge_dimension: range_index,
+                    self.edge_dimension: pd.RangeIndex(0, self.n_edge),
                 }
                 return self, indexes
             else:
@@ -606,7 +609,7 @@ class Ugrid1d(AbstractUgrid):
         # N.B. edges do not contain fill values, as there are always two nodes
         # required to form an edge.
         edge_subset = self.edge_node_connectivity[edge_index]
-        node_index = np.unique(edge_subset.ravel())
+        node_index = connectivity.unique_indices(edge_subset, self.n_node)
         new_edges = connectivity.renumber(edge_subset)
         node_x = self.node_x[node_index]
         node_y = self.node_y[node_index]
@@ -29,7 +29,14 @@ from xugrid.constants import (
 from xugrid.core.utils import either_dict_or_kwargs
 from xugrid.ugrid import connectivity, conventions
 from xugrid.ugrid.selection_utils import section_coordinates_2d
-from xugrid.ugrid.ugridbase import AbstractUgrid, as_pandas_index, numeric_bound
+from xugrid.ugrid.ugridbase import (
+    AbstractUgrid,
+    as_pandas_index,
+    element_bounds,
+    is_range_index,
+    numeric_bound,
+    take_xy,
+)
 from xugrid.ugrid.voronoi import voronoi_topology
 
 
@@ -139,6 +146,8 @@ class Ugrid2d(AbstractUgrid):
         # Edges
         self._edge_x = None
         self._edge_y = None
+        # Fingerprint for equality checks
+        self._fingerprint = None
         # Connectivity
         self._edge_node_connectivity = edge_node_connectivity
         if self._edge_node_connectivity is not None:
@@ -187,6 +196,8 @@ class Ugrid2d(AbstractUgrid):
         # Edges
         self._edge_x = None
         self._edge_y = None
+        # Fingerprint for equality checks
+        self._fingerprint = None
         # Derived topology
         self._triangulation = None
         self._voronoi_topology = None
@@ -582,19 +593,7 @@ class Ugrid2d(AbstractUgrid):
         -------
         face_bounds: np.ndarray of shape (n_face, 4)
         """
-        x = self.node_x[self.face_node_connectivity]
-        y = self.node_y[self.face_node_connectivity]
-        isfill = self.face_node_connectivity == FILL_VALUE
-        x[isfill] = np.nan
-        y[isfill] = np.nan
-        return np.column_stack(
-            [
-                np.nanmin(x, axis=1),
-                np.nanmin(y, axis=1),
-                np.nanmax(x, axis=1),
-                np.nanmax(y, axis=1),
-            ]
-        )
+        return element_bounds(self.node_x, self.node_y, self.face_node_connectivity)
 
     @property
     def face_x(self):
@@ -628,13 +627,7 @@ class Ugrid2d(AbstractUgrid):
         -------
         face_node_coordinates: ndarray of floats with shape ``(n_face, n_max_node_per_face, 2)``
         """
-        coords = np.full(
-            (self.n_face, self.n_max_node_per_face, 2), np.nan, dtype=FloatDType
-        )
-        is_node = self.face_node_connectivity != FILL_VALUE
-        index = self.face_node_connectivity[is_node]
-        coords[is_node, :] = self.node_coordinates[index]
-        return coords
+        return take_xy(self.node_x, self.node_y, self.face_node_connectivity)
 
     @property
     def edge_face_connectivity(self) -> IntArray:
@@ -1053,11 +1046,16 @@ class Ugrid2d(AbstractUgrid):
         -------
         x: 1d array of floats with shape ``(ncol,)``
         y: 1d array of floats with shape ``(nrow,)``
-        face_index: 1d array of integers with shape ``(nrow * ncol,)``
-        """
-        yy, xx = np.meshgrid(y, x, indexing="ij")
-        nodes = np.column_stack([xx.ravel(), yy.ravel()])
-        index = self.celltree.locate_points(nodes).reshape((y.size, x.size))
+        face_index: 2d array of integers with shape ``(nrow, ncol)``
+        """
+        # Write the interleaved (x, y) pairs directly into the output, rather
+        # than creating a meshgrid and stacking its columns.
+        nodes = np.empty((y.size, x.size, 2), dtype=np.result_type(x, y, float))
+        nodes[..., 0] = x
+        nodes[..., 1] = y[:, np.newaxis]
+        index = self.celltree.locate_points(nodes.reshape((-1, 2))).reshape(
+            (y.size, x.size)
+        )
         return x, y, index
 
     def rasterize(
@@ -1082,18 +1080,18 @@ class Ugrid2d(AbstractUgrid):
         -------
         x: 1d array of floats with shape ``(ncol,)``
         y: 1d array of floats with shape ``(nrow,)``
-        face_index: 1d array of integers with shape ``(nrow * ncol,)``
+        face_index: 2d array of integers with shape ``(nrow, ncol)``
         """
         if bounds is None:
             bounds = self.bounds
         xmin, ymin, xmax, ymax = bounds
         d = abs(resolution)
-        xmin = np.floor(xmin / d) * d
-        xmax = np.ceil(xmax / d) * d
-        ymin = np.floor(ymin / d) * d
-        ymax = np.ceil(ymax / d) * d
-        x = np.arange(xmin + 0.5 * d, xmax, d)
-        y = np.arange(ymax - 0.5 * d, ymin, -d)
+        # Snap to whole cells in float64 and use an integer range: snapping
+        # (float32) bounds in their own precision may lose or add a cell.
+        ixmin, iymin = np.floor(np.array([xmin, ymin], dtype=float) / d).astype(int)
+        ixmax, iymax = np.ceil(np.array([xmax, ymax], dtype=float) / d).astype(int)
+        x = (np.arange(ixmin, ixmax) + 0.5) * d
+        y = (np.arange(iymax, iymin, -1) - 0.5) * d
         return self.rasterize_like(x, y)
 
     def topology_subset(
@@ -1122,14 +1120,13 @@ class Ugrid2d(AbstractUgrid):
 
         # The pandas index may only contain uniques. So if size matches, it may
         # be the identity.
-        range_index = pd.RangeIndex(0, self.n_face)
-        if face_index.size == self.n_face and face_index.equals(range_index):
+        if is_range_index(face_index, self.n_face):
             # TODO: return self.copy instead?
             if return_index:
                 indexes = {
                     self.node_dimension: pd.RangeIndex(0, self.n_node),
                     self.edge_dimension: pd.RangeIndex(0, self.n_edge),
-                    self.face_dimension: range_index,
+                    self.face_dimension: pd.RangeIndex(0, self.n_face),
                 }
                 return self, indexes
             else:
@@ -1137,8 +1134,7 @@ class Ugrid2d(AbstractUgrid):
 
         index = face_index.to_numpy()
         face_subset = self.face_node_connectivity[index]
-        node_index = np.unique(face_subset.ravel())
-        node_index = node_index[node_index != FILL_VALUE]
+        node_index = connectivity.unique_indices(face_subset, self.n_node)
         new_faces = connectivity.renumber(face_subset)
         node_x = self.node_x[node_index]
         node_y = self.node_y[node_index]
@@ -1146,8 +1142,9 @@ class Ugrid2d(AbstractUgrid):
         edge_index = None
         new_edges = None
         if self.edge_node_connectivity is not None:
-            edge_index = np.unique(self.face_edge_connectivity[index].ravel())
-            edge_index = edge_index[edge_index != FILL_VALUE]
+            edge_index = connectivity.unique_indices(
+                self.face_edge_connectivity[index], self.n_edge
+            )
             edge_subset = self.edge_node_connectivity[edge_index]
             new_edges = connectivity.renumber(edge_subset)
 
@@ -2156,7 +2153,7 @@ class Ugrid2d(AbstractUgrid):
         def _bbox_area(bounds):
             return (bounds[2] - bounds[0]) * (bounds[3] - bounds[1])
 
-        edges = self.node_coordinates[self.boundary_node_connectivity]
+        edges = take_xy(self.node_x, self.node_y, self.boundary_node_connectivity)
         collection = shapely.polygonize(shapely.linestrings(edges))
         polygon = max(collection.geoms, key=lambda x: _bbox_area(x.bounds))
         return polygon
@@ -1,9 +1,11 @@
 import abc
 import copy
+import hashlib
 import warnings
 from itertools import chain
 from typing import Dict, Literal, Optional, Sequence, Set, Tuple, Type, Union, cast
 
+import numba as nb
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -12,10 +14,26 @@ from numpy.typing import ArrayLike
 from scipy.sparse import coo_matrix, csr_matrix
 from scipy.spatial import KDTree
 
-from xugrid.constants import FILL_VALUE, BoolArray, FloatArray, IntArray
+from xugrid.constants import FILL_VALUE, BoolArray, FloatArray, FloatDType, IntArray
 from xugrid.ugrid import connectivity, conventions
 from xugrid.ugrid.selection_utils import get_sorted_section_coords
 
+# Names of the attributes referring to dimensions, connectivity variables, and
+# coordinate variables, per topology dimension. Used to filter the attrs.
+_UGRID_DIM_NAMES = {
+    topodim: frozenset(
+        names + tuple(dims[0] for dims in conventions._CONNECTIVITY_DIMS.values())
+    )
+    for topodim, names in conventions._DIM_NAMES.items()
+}
+_CONNECTIVITY_NAMES = {
+    topodim: frozenset(names)
+    for topodim, names in conventions._CONNECTIVITY_NAMES.items()
+}
+_COORD_NAMES = {
+    topodim: frozenset(names) for topodim, names in conventions._COORD_NAMES.items()
+}
+
 
 def numeric_bound(v: Union[float, None], other: float):
     if v is None:
@@ -24,6 +42,194 @@ def numeric_bound(v: Union[float, None], other: float):
         return v
 
 
+@nb.njit(parallel=True, cache=True)
+def _minmax_xy(x: FloatArray, y: FloatArray) -> Tuple[float, float, float, float]:
+    """
+    Compute xmin, ymin, xmax, ymax in a single pass over x and y.
+
+    As with np.min and np.max, NaN values propagate.
+    """
+    xmin = np.inf
+    ymin = np.inf
+    xmax = -np.inf
+    ymax = -np.inf
+    xnan = 0
+    ynan = 0
+    for i in nb.prange(x.size):
+        xmin = min(xmin, x[i])
+        ymin = min(ymin, y[i])
+        xmax = max(xmax, x[i])
+        ymax = max(ymax, y[i])
+        # min and max skip NaN values depending on the argument order: count
+        # them instead.
+        if x[i] != x[i]:
+            xnan += 1
+        if y[i] != y[i]:
+            ynan += 1
+    if xnan > 0:
+        xmin = np.nan
+        xmax = np.nan
+    if ynan > 0:
+        ymin = np.nan
+        ymax = np.nan
+    return xmin, ymin, xmax, ymax
+
+
+@nb.njit(parallel=True, cache=True)
+def _element_bounds(
+    x: FloatArray, y: FloatArray, connectivity: IntArray, bounds: FloatArray
+) -> None:
+    n, m = connectivity.shape
+    for i in nb.prange(n):
+        xmin = np.inf
+        ymin = np.inf
+        xmax = -np.inf
+        ymax = -np.inf
+        for j in range(m):
+            node = connectivity[i, j]
+            if node == FILL_VALUE:
+                continue
+            xmin = min(xmin, x[node])
+            ymin = min(ymin, y[node])
+            xmax = max(xmax, x[node])
+            ymax = max(ymax, y[node])
+        bounds[i, 0] = xmin
+        bounds[i, 1] = ymin
+        bounds[i, 2] = xmax
+        bounds[i, 3] = ymax
+
+
+def _coordinate_dtype(x: FloatArray, y: FloatArray) -> np.dtype:
+    """Return the floating point dtype of x and y, which can hold NaN."""
+    dtype = np.result_type(x, y)
+    if dtype.kind != "f":
+        return np.dtype(FloatDType)
+    return dtype
+
+
+def element_bounds(x: FloatArray, y: FloatArray, connectivity: IntArray) -> FloatArray:
+    """
+    Compute xmin, ymin, xmax, ymax of the nodes of every row of the
+    connectivity in a single pass, skipping fill values.
+    """
+    bounds = np.empty((connectivity.shape[0], 4), dtype=_coordinate_dtype(x, y))
+    _element_bounds(x, y, connectivity, bounds)
+    return bounds
+
+
+def _stack_xy(x: FloatArray, y: FloatArray) -> FloatArray:
+    """Stack x and y into an (N, 2) array, without temporaries."""
+    xy = np.empty((x.size, 2), dtype=np.result_type(x, y))
+    xy[:, 0] = x
+    xy[:, 1] = y
+    return xy
+
+
+@nb.njit(parallel=True, cache=True)
+def _take_xy(x: FloatArray, y: FloatArray, index: IntArray, xy: FloatArray) -> None:
+    for i in nb.prange(index.size):
+        j = index[i]
+        if j == FILL_VALUE:
+            xy[i, 0] = np.nan
+            xy[i, 1] = np.nan
+        else:
+            xy[i, 0] = x[j]
+            xy[i, 1] = y[j]
+
+
+def take_xy(x: FloatArray, y: FloatArray, index: IntArray) -> FloatArray:
+    """
+    Gather the (x, y) coordinates of the points in index into an array of
+    shape ``(*index.shape, 2)``. FILL_VALUE entries are set to NaN.
+
+    Reads x and y in a single pass, instead of first stacking all coordinates
+    into an (N, 2) array and then indexing it.
+    """
+    index = np.asarray(index)
+    xy = np.empty((*index.shape, 2), dtype=_coordinate_dtype(x, y))
+    _take_xy(x, y, index.ravel(), xy.reshape((-1, 2)))
+    return xy
+
+
+@nb.njit(parallel=True, cache=True)
+def _edge_midpoints(
+    x: FloatArray,
+    y: FloatArray,
+    edge_node_connectivity: IntArray,
+    edge_x: FloatArray,
+    edge_y: FloatArray,
+) -> None:
+    for i in nb.prange(edge_node_connectivity.shape[0]):
+        a = edge_node_connectivity[i, 0]
+        b = edge_node_connectivity[i, 1]
+        edge_x[i] = 0.5 * (x[a] + x[b])
+        edge_y[i] = 0.5 * (y[a] + y[b])
+
+
+def edge_midpoints(
+    x: FloatArray, y: FloatArray, edge_node_connectivity: IntArray
+) -> Tuple[FloatArray, FloatArray]:
+    """Compute the x and y midpoints of every edge in a single pass."""
+    n_edge = edge_node_connectivity.shape[0]
+    dtype = _coordinate_dtype(x, y)
+    edge_x = np.empty(n_edge, dtype=dtype)
+    edge_y = np.empty(n_edge, dtype=dtype)
+    _edge_midpoints(x, y, edge_node_connectivity, edge_x, edge_y)
+    return edge_x, edge_y
+
+
+@nb.njit(cache=True)
+def _prepare_connectivity_values(data, fill, fill_is_nan, fill_value, out) -> bool:
+    """
+    Replace fill values and cast data into out in a single pass.
+
+    Returns False as soon as a negative (non-fill) value is encountered.
+    """
+    for i in range(data.size):
+        v = data[i]
+        if (fill_is_nan and np.isnan(v)) or (not fill_is_nan and v == fill):
+            out[i] = fill_value
+        else:
+            out[i] = v
+            if out[i] < 0:
+                return False
+    return True
+
+
+def _scalar_of_dtype(value, dtype: np.dtype):
+    """
+    Return value as a scalar of dtype, or None if dtype cannot represent it
+    exactly (e.g. 99999 for int16, -999.5 or NaN for integers).
+    """
+    try:
+        with np.errstate(over="ignore", invalid="ignore"):
+            converted = dtype.type(value)
+    except (OverflowError, ValueError):
+        return None
+    if converted != value:
+        return None
+    return converted
+
+
+def fingerprint(*arrays: np.ndarray) -> Tuple[Tuple[str, ...], bytes]:
+    """
+    Return the dtypes, and a SHA-256 digest of the shapes and values of the
+    arrays. Floats are normalized first so that -0.0 and 0.0, and all NaNs,
+    hash the same, as they compare equal in xarray's identical.
+    """
+    h = hashlib.sha256()
+    dtypes = []
+    for a in arrays:
+        a = np.asarray(a)
+        if a.dtype.kind == "f":
+            a = a + 0.0
+            a[np.isnan(a)] = np.nan
+        dtypes.append(a.dtype.str)
+        h.update(repr(a.shape).encode())
+        h.update(np.ascontiguousarray(a).data)
+    return tuple(dtypes), h.digest()
+
+
 def as_pandas_index(index: Union[BoolArray, IntArray, pd.Index], n: int):
     if isinstance(index, np.ndarray):
         if index.size > n:
@@ -31,11 +237,17 @@ def as_pandas_index(index: Union[BoolArray, IntArray, pd.Index], n: int):
                 f"index size {index.size} is larger than dimension size: {n}"
             )
         if np.issubdtype(index.dtype, np.bool_):
-            # Significantly quicker if all true.
+            if index.size != n:
+                raise ValueError(
+                    f"boolean index size {index.size} does not match dimension "
+                    f"size: {n}"
+                )
+            # Significantly quicker if all true. all() stops at the first
+            # False, so this is cheap for sparse subsets too.
             if index.all():
                 pd_index = pd.RangeIndex(0, n)
             else:
-                pd_index = pd.Index((np.arange(n)[index]))
+                pd_index = pd.Index(np.flatnonzero(index))
         elif np.issubdtype(index.dtype, np.integer):
             pd_index = pd.Index(index)
         else:
@@ -63,6 +275,31 @@ def as_pandas_index(index: Union[BoolArray, IntArray, pd.Index], n: int):
     return pd_index
 
 
+@nb.njit(cache=True)
+def _is_range(index: IntArray) -> bool:
+    for i in range(index.size):
+        if index[i] != i:
+            return False
+    return True
+
+
+def is_range_index(index: pd.Index, n: int) -> bool:
+    """
+    Check whether index is equal to RangeIndex(0, n).
+
+    Unlike pd.Index.equals, this does not materialize the range, and returns
+    at the first mismatch.
+    """
+    if index.size != n:
+        return False
+    if isinstance(index, pd.RangeIndex):
+        return index.start == 0 and (n < 2 or index.step == 1)
+    values = index.to_numpy()
+    if not np.issubdtype(values.dtype, np.integer):
+        return False
+    return _is_range(values)
+
+
 def align(obj, grids, old_indexes):
     """
     Check which indexes have changed. Index on those new values.
@@ -364,27 +601,26 @@ class AbstractUgrid(abc.ABC):
     def _filtered_attrs(self, dataset: xr.Dataset):
         """Remove names that are not present in the dataset."""
         topodim = self.topology_dimension
-        attrs = self._attrs.copy()
-
-        ugrid_dims = conventions._DIM_NAMES[topodim] + tuple(
-            [dims[0] for dims in conventions._CONNECTIVITY_DIMS.values()]
-        )
-        for key in ugrid_dims:
-            if key in attrs and attrs[key] not in dataset.dims:
-                attrs.pop(key)
-
-        for key in conventions._CONNECTIVITY_NAMES[topodim]:
-            if key in attrs and attrs[key] not in dataset:
-                attrs.pop(key)
-
-        for coord in conventions._COORD_NAMES[topodim]:
-            if coord in attrs:
-                names = attrs[coord].split(" ")
-                present = [name for name in names if name in dataset]
-                if present:
-                    attrs[coord] = " ".join(present)
-                else:
-                    attrs.pop(coord)
+        ugrid_dims = _UGRID_DIM_NAMES[topodim]
+        connectivity_names = _CONNECTIVITY_NAMES[topodim]
+        coord_names = _COORD_NAMES[topodim]
+        dims = dataset.dims
+
+        # Build the filtered attrs in a single pass, rather than copying all
+        # attrs and popping the absent names afterwards.
+        attrs = {}
+        for key, value in self._attrs.items():
+            if key in ugrid_dims:
+                if value not in dims:
+                    continue
+            elif key in connectivity_names:
+                if value not in dataset:
+                    continue
+            elif key in coord_names:
+                value = " ".join(name for name in value.split(" ") if name in dataset)
+                if not value:
+                    continue
+            attrs[key] = value
 
         return attrs
 
@@ -394,18 +630,46 @@ class AbstractUgrid(abc.ABC):
         else:
             return self.to_dataset().__repr__()
 
+    def _get_fingerprint(self) -> Tuple[Tuple[str, ...], bytes]:
+        if self._fingerprint is None:
+            topodim = self.topology_dimension
+            core_connectivity = conventions._CONNECTIVITY_NAMES[topodim][0]
+            self._fingerprint = fingerprint(
+                self.node_x, self.node_y, getattr(self, core_connectivity)
+            )
+        return self._fingerprint
+
     def equals(self, other) -> bool:
         if other is self:
             return True
         elif isinstance(other, type(self)):
+            # Fast path: differing node coordinates or connectivity mean the
+            # grids cannot be identical. The fingerprints are cached, so
+            # repeated comparisons (e.g. in unique_grids) are cheap. If the
+            # dtypes differ, the values may still compare equal.
+            dtypes, digest = self._get_fingerprint()
+            other_dtypes, other_digest = other._get_fingerprint()
+            if dtypes == other_dtypes and digest != other_digest:
+                return False
             xr_self = self.to_dataset()
             xr_other = other.to_dataset()
             return xr_self.identical(xr_other)
         return False
 
     def copy(self):
-        """Create a deepcopy."""
-        return copy.deepcopy(self)
+        """
+        Create a copy.
+
+        The copy shares the numpy arrays and the cached derived properties
+        with this grid: these are treated as immutable, and are replaced
+        rather than modified in place. Only the mutable attrs and indexes
+        dictionaries are copied. Use ``copy.deepcopy`` to copy all arrays.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._attrs = self._attrs.copy()
+        new._indexes = self._indexes.copy()
+        return new
 
     @property
     def fill_value(self) -> int:
@@ -452,7 +716,7 @@ class AbstractUgrid(abc.ABC):
     @property
     def node_coordinates(self) -> FloatArray:
         """Coordinates (x, y) of the nodes (vertices)"""
-        return np.column_stack([self.node_x, self.node_y])
+        return _stack_xy(self.node_x, self.node_y)
 
     @property
     def n_node(self) -> int:
@@ -464,29 +728,34 @@ class AbstractUgrid(abc.ABC):
         """Number of edges in the UGRID topology"""
         return self.edge_node_connectivity.shape[0]
 
+    def _compute_edge_xy(self) -> None:
+        self._edge_x, self._edge_y = edge_midpoints(
+            self.node_x, self.node_y, self.edge_node_connectivity
+        )
+
     @property
     def edge_x(self):
         """x-coordinate of every edge in the UGRID topology"""
         if self._edge_x is None:
-            self._edge_x = self.node_x[self.edge_node_connectivity].mean(axis=1)
+            self._compute_edge_xy()
         return self._edge_x
 
     @property
     def edge_y(self):
         """y-coordinate of every edge in the UGRID topology"""
         if self._edge_y is None:
-            self._edge_y = self.node_y[self.edge_node_connectivity].mean(axis=1)
+            self._compute_edge_xy()
         return self._edge_y
 
     @property
     def edge_coordinates(self) -> FloatArray:
         """Centroid (x,y) coordinates of every edge in the UGRID topology"""
-        return np.column_stack([self.edge_x, self.edge_y])
+        return _stack_xy(self.edge_x, self.edge_y)
 
     @property
     def edge_node_coordinates(self) -> FloatArray:
         """Node coordinates for every edge, shape: ``n_edge, 2, 2``."""
-        return self.node_coordinates[self.edge_node_connectivity]
+        return take_xy(self.node_x, self.node_y, self.edge_node_connectivity)
 
     @property
     @abc.abstractmethod
@@ -496,18 +765,23 @@ class AbstractUgrid(abc.ABC):
     @property
     def bounds(self) -> Tuple[float, float, float, float]:
         """Returns a tuple with the node bounds: xmin, ymin, xmax, ymax"""
-        if any(
-            [
-                self._xmin is None,
-                self._ymin is None,
-                self._xmax is None,
-                self._ymax is None,
-            ]
-        ):
-            self._xmin = self.node_x.min()
-            self._ymin = self.node_y.min()
-            self._xmax = self.node_x.max()
-            self._ymax = self.node_y.max()
+        # The four bounds are always computed and cleared together: one
+        # sentinel suffices.
+        if self._xmin is None:
+            if self.node_x.size == 0:
+                # Raise as node_x.min() would.
+                raise ValueError(
+                    "zero-size array to reduction operation minimum which has "
+                    "no identity"
+                )
+            xmin, ymin, xmax, ymax = _minmax_xy(self.node_x, self.node_y)
+            # Return scalars of the coordinate dtype, as node_x.min() would.
+            xtype = self.node_x.dtype.type
+            ytype = self.node_y.dtype.type
+            self._xmin = xtype(xmin)
+            self._ymin = ytype(ymin)
+            self._xmax = xtype(xmax)
+            self._ymax = ytype(ymax)
         return (
             self._xmin,
             self._ymin,
@@ -525,16 +799,7 @@ class AbstractUgrid(abc.ABC):
         -------
         edge_bounds: np.ndarray of shape (n_edge, 4)
         """
-        x = self.node_x[self.edge_node_connectivity]
-        y = self.node_y[self.edge_node_connectivity]
-        return np.column_stack(
-            [
-                x.min(axis=1),
-                y.min(axis=1),
-                x.max(axis=1),
-                y.max(axis=1),
-            ]
-        )
+        return element_bounds(self.node_x, self.node_y, self.edge_node_connectivity)
 
     @staticmethod
     def _prepare_connectivity(
@@ -545,19 +810,31 @@ class AbstractUgrid(abc.ABC):
         connectivity arrays. Set an external unified value back (across all
         connectivities!), and cast back to the desired dtype.
         """
-        data = da.to_numpy().copy()
+        data = da.to_numpy()
+        cast = np.empty(data.shape, dtype=dtype)
         # If xarray detects a _FillValue, it converts the array to floats and
         # replaces the fill value by NaN, and moves the _FillValue to
         # da.encoding.
+        # Compare against a fill value of the same type as the data (as CF
+        # requires): the comparison then stays within the data's dtype, and the
+        # numba kernel is only compiled once per data and output dtype.
         if "_FillValue" in da.attrs:
-            is_fill = data == da.attrs["_FillValue"]
+            fill = _scalar_of_dtype(da.attrs["_FillValue"], data.dtype)
+            fill_is_nan = False
+            if fill is None:
+                # The data's dtype cannot represent the fill value, so no
+                # entry equals it. Check for NaN instead, which never matches
+                # integer data.
+                fill = data.dtype.type(0)
+                fill_is_nan = True
         else:
-            is_fill = np.isnan(data)
-        # Set the fill_value before casting: otherwise the cast may fail.
-        data[is_fill] = fill_value
-        cast = data.astype(dtype, copy=False)
-        not_fill = ~is_fill
-        if (cast[not_fill] < 0).any():
+            fill = data.dtype.type(0)
+            fill_is_nan = True
+        # Set the fill_value while casting: otherwise the cast may fail.
+        valid = _prepare_connectivity_values(
+            data.ravel(), fill, fill_is_nan, cast.dtype.type(fill_value), cast.ravel()
+        )
+        if not valid:
             raise ValueError("connectivity contains negative values")
         return da.copy(data=cast)
 
@@ -623,8 +900,19 @@ class AbstractUgrid(abc.ABC):
         if " " in node_x or " " in node_y:
             raise ValueError("coordinate names may not contain spaces")
 
-        x = obj[node_x].to_numpy()
-        y = obj[node_y].to_numpy()
+        x_var = obj[node_x].variable
+        y_var = obj[node_y].variable
+        x_data = x_var.data
+        y_data = y_var.data
+        if isinstance(x_data, np.ndarray) and isinstance(y_data, np.ndarray):
+            x = x_data
+            y = y_data
+        else:
+            # Load lazy (e.g. dask) coordinates in a single compute, so that
+            # shared dependencies (such as reading the file) are evaluated once.
+            loaded = xr.Dataset({"x": x_var, "y": y_var}).compute()
+            x = loaded["x"].to_numpy()
+            y = loaded["y"].to_numpy()
 
         if (x.ndim != 1) or (x.size != self.n_node):
             raise ValueError(
@@ -920,6 +1208,8 @@ class AbstractUgrid(abc.ABC):
         transformer = pyproj.Transformer.from_crs(
             crs_from=self.crs, crs_to=crs, always_xy=True
         )
+        # Do not transform in place (inplace=True): the copy shares its node
+        # coordinate arrays with self, which would be reprojected as well.
         node_x, node_y = transformer.transform(xx=grid.node_x, yy=grid.node_y)
         grid.node_x = node_x
         grid.node_y = node_y
@@ -1024,7 +1314,7 @@ class AbstractUgrid(abc.ABC):
         xy = np.column_stack([x, y])
         index = self.locate_points(xy, tolerance)
 
-        keep = slice(None, None)  # keep all by default
+        keep = None  # keep all by default
         condition = None
         valid = index != -1
         if not valid.all():
@@ -1036,14 +1326,15 @@ class AbstractUgrid(abc.ABC):
                     warnings.warn(msg)
                 condition = xr.DataArray(valid, dims=(dim,))
             elif out_of_bounds == "drop":
-                index = index[valid]
-                keep = valid
+                keep = np.flatnonzero(valid)
+                index = index[keep]
+                xy = xy[keep]
 
         # Create the selection DataArray or Dataset
         coords = {
-            f"{self.name}_index": (dim, np.arange(len(xy))[keep]),
-            f"{self.name}_x": (dim, xy[keep, 0]),
-            f"{self.name}_y": (dim, xy[keep, 1]),
+            f"{self.name}_index": (dim, np.arange(len(xy)) if keep is None else keep),
+            f"{self.name}_x": (dim, xy[:, 0]),
+            f"{self.name}_y": (dim, xy[:, 1]),
         }
         selection = obj.isel({dim: index}).assign_coords(coords)
 